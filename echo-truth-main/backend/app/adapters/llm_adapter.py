@@ -18,9 +18,107 @@ Get your API keys from:
 ============================================
 """
 
+import logging
+import asyncio
+import random
+import httpx
 from typing import Optional
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# ============================================
+# SHARED HTTP CLIENT
+# One pooled client per process keeps TCP/TLS
+# connections alive across LLM calls.
+# Closed on app shutdown (see main.py).
+# ============================================
+_HTTPX: Optional[httpx.AsyncClient] = None
+
+# Provider SDK clients, created once under _client_lock
+_client_lock = asyncio.Lock()
+_openai_client = None
+_gemini_configured = False
+_gemini_models: dict = {}
+
+# ============================================
+# CONCURRENCY LIMIT + RETRY
+# Caps in-flight LLM calls per process (LLM_MAX_CONCURRENCY)
+# and retries rate-limited calls with jittered backoff.
+# ============================================
+_sem = asyncio.Semaphore(settings.LLM_MAX_CONCURRENCY)
+_MAX_ATTEMPTS = 3
+_BACKOFF_BASE = 0.5
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared httpx client, creating it on first use"""
+    global _HTTPX
+    if _HTTPX is None or _HTTPX.is_closed:
+        _HTTPX = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+            timeout=30.0,
+            http2=True,
+        )
+    return _HTTPX
+
+
+async def close_client() -> None:
+    """Close the shared httpx client (called on app shutdown)"""
+    global _HTTPX, _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+    _HTTPX = None
+    _openai_client = None
+
+
+async def _get_openai_client(api_key: str):
+    """Return the shared openai.AsyncOpenAI client"""
+    global _openai_client
+    if _openai_client is None:
+        async with _client_lock:
+            if _openai_client is None:
+                import openai
+                
+                # SDK retries off: the jittered 429 backoff in
+                # LLMAdapter is the only retry policy
+                _openai_client = openai.AsyncOpenAI(
+                    api_key=api_key,
+                    http_client=await _get_client(),
+                    max_retries=0,
+                )
+    return _openai_client
+
+
+async def _get_gemini_model(api_key: str, model_name: str):
+    """Configure Gemini once and return a cached GenerativeModel"""
+    global _gemini_configured
+    model = _gemini_models.get(model_name)
+    if model is None:
+        async with _client_lock:
+            import google.generativeai as genai
+            
+            if not _gemini_configured:
+                genai.configure(api_key=api_key)
+                _gemini_configured = True
+            
+            model = _gemini_models.get(model_name)
+            if model is None:
+                model = genai.GenerativeModel(model_name)
+                _gemini_models[model_name] = model
+    return model
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """True if the provider rejected the call with a 429 / rate limit"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429
+    # openai.RateLimitError / google ResourceExhausted, matched by name
+    # so the provider SDKs stay optional imports
+    return type(error).__name__ in ("RateLimitError", "ResourceExhausted")
+
 
 class LLMAdapter:
     """
@@ -37,6 +135,9 @@ class LLMAdapter:
     2. Set LLM_API_KEY in .env
     3. Optionally set LLM_MODEL for specific model
     ============================================
+    
+    Temperature is 0.0 so responses are deterministic
+    and safe to cache (see services/llm_cache.py).
     """
     
     def __init__(self):
@@ -44,36 +145,50 @@ class LLMAdapter:
         self.api_key = settings.LLM_API_KEY
         self.model = settings.LLM_MODEL
     
-    async def generate(self, prompt: str) -> Optional[str]:
+    async def generate(self, prompt: str, max_tokens: int = 300) -> Optional[str]:
         """
         Generate LLM response
         
         Args:
             prompt: The prompt to send to LLM
+            max_tokens: Output token limit (raised for batched prompts)
             
         Returns:
             Generated text or None if failed
         """
         if not self.api_key:
-            print("Warning: LLM_API_KEY not configured, skipping LLM call")
+            logger.warning("LLM_API_KEY not configured, skipping LLM call")
             return None
         
-        try:
-            if self.provider == "openai":
-                return await self._call_openai(prompt)
-            elif self.provider == "gemini":
-                return await self._call_gemini(prompt)
-            elif self.provider == "groq":
-                return await self._call_groq(prompt)
-            else:
-                print(f"Unknown LLM provider: {self.provider}")
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                async with _sem:
+                    return await self._dispatch(prompt, max_tokens)
+                    
+            except Exception as e:
+                if _is_rate_limited(e) and attempt < _MAX_ATTEMPTS - 1:
+                    # Randomized exponential backoff, then retry
+                    delay = _BACKOFF_BASE * (2 ** attempt) + random.uniform(0, _BACKOFF_BASE)
+                    await asyncio.sleep(delay)
+                    continue
+                logger.warning("LLM call failed: %s", e)
                 return None
-                
-        except Exception as e:
-            print(f"LLM call failed: {e}")
+        
+        return None
+    
+    async def _dispatch(self, prompt: str, max_tokens: int) -> Optional[str]:
+        """Route the prompt to the configured provider"""
+        if self.provider == "openai":
+            return await self._call_openai(prompt, max_tokens)
+        elif self.provider == "gemini":
+            return await self._call_gemini(prompt, max_tokens)
+        elif self.provider == "groq":
+            return await self._call_groq(prompt, max_tokens)
+        else:
+            logger.warning("Unknown LLM provider: %s", self.provider)
             return None
     
-    async def _call_openai(self, prompt: str) -> Optional[str]:
+    async def _call_openai(self, prompt: str, max_tokens: int = 300) -> Optional[str]:
         """
         Call OpenAI API
         
@@ -82,22 +197,20 @@ class LLMAdapter:
         Get from: https://platform.openai.com/api-keys
         ============================================
         """
-        import openai
-        
-        client = openai.OpenAI(api_key=self.api_key)
+        client = await _get_openai_client(self.api_key)
         
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=self.model or "gpt-4o-mini",
             messages=[
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3,
-            max_tokens=300,
+            temperature=0.0,
+            max_tokens=max_tokens,
         )
         
         return response.choices[0].message.content
     
-    async def _call_gemini(self, prompt: str) -> Optional[str]:
+    async def _call_gemini(self, prompt: str, max_tokens: int = 300) -> Optional[str]:
         """
         Call Google Gemini API
         
@@ -106,23 +219,21 @@ class LLMAdapter:
         Get from: https://makersuite.google.com/app/apikey
         ============================================
         """
-        import google.generativeai as genai
-        
-        genai.configure(api_key=self.api_key)
-        
-        model = genai.GenerativeModel(self.model or "gemini-1.5-flash")
+        model = await _get_gemini_model(
+            self.api_key, self.model or "gemini-1.5-flash"
+        )
         
-        response = model.generate_content(
+        response = await model.generate_content_async(
             prompt,
             generation_config={
-                "temperature": 0.3,
-                "max_output_tokens": 300,
+                "temperature": 0.0,
+                "max_output_tokens": max_tokens,
             }
         )
         
         return response.text
     
-    async def _call_groq(self, prompt: str) -> Optional[str]:
+    async def _call_groq(self, prompt: str, max_tokens: int = 300) -> Optional[str]:
         """
         Call Groq API (Llama models)
         
@@ -131,9 +242,9 @@ class LLMAdapter:
         Get from: https://console.groq.com/keys
         ============================================
         """
-        import requests
+        client = await _get_client()
         
-        response = requests.post(
+        response = await client.post(
             "https://api.groq.com/openai/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {self.api_key}",
@@ -144,8 +255,8 @@ class LLMAdapter:
                 "messages": [
                     {"role": "user", "content": prompt}
                 ],
-                "temperature": 0.3,
-                "max_tokens": 300,
+                "temperature": 0.0,
+                "max_tokens": max_tokens,
             },
             timeout=30,
         )
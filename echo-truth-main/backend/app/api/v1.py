@@ -2,18 +2,27 @@
 v1.py
 API v1 routes
 
-Main API endpoint for voice detection.
+Main API endpoints for voice detection.
 POST /api/v1/detect
+POST /api/v1/detect/batch
 """
 
+import logging
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from typing import List, Optional, Literal, Union
+from app.config import settings
 from app.middleware.api_key import verify_api_key
-from app.controllers.detect import DetectController
+from app.controllers.detect import _CONTROLLER as controller
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Fields returned by /detect (see DetectResponse)
+_RESPONSE_FIELDS = ("classification", "confidence", "explanation")
+
 
 class DetectRequest(BaseModel):
     """
@@ -56,10 +65,33 @@ class ErrorResponse(BaseModel):
     detail: str
 
 
+class DetectBatchRequest(BaseModel):
+    """Request body for batch detection (one DetectRequest per clip)"""
+    items: List[DetectRequest] = Field(
+        ...,
+        min_items=1,
+        max_items=settings.BATCH_MAX_ITEMS,
+        description="Audio clips to analyze",
+    )
+
+
+class DetectBatchResponse(BaseModel):
+    """
+    Response from batch detection
+    
+    One entry per request item, in the same order: a
+    classification result, or an error for that item alone.
+    """
+    results: List[Union[DetectResponse, ErrorResponse]]
+
+
 @router.post(
     "/detect",
-    response_model=DetectResponse,
+    # DetectResponse is kept for the OpenAPI docs only; results from
+    # DecisionService are already validated, so skip re-validation
+    response_model=None,
     responses={
+        200: {"model": DetectResponse, "description": "Classification result"},
         400: {"model": ErrorResponse, "description": "Missing audio"},
         401: {"model": ErrorResponse, "description": "Invalid API key"},
         422: {"model": ErrorResponse, "description": "Audio processing error"},
@@ -81,7 +113,7 @@ class ErrorResponse(BaseModel):
 async def detect_voice(
     request: DetectRequest,
     _: bool = Depends(verify_api_key),
-) -> DetectResponse:
+) -> ORJSONResponse:
     """
     Main detection endpoint
     
@@ -100,22 +132,73 @@ async def detect_voice(
             detail="Missing audio: provide either audio_url or audio_base64"
         )
     
-    # Initialize controller and process
-    controller = DetectController()
-    
     try:
         result = await controller.detect(
             audio_url=request.audio_url,
             audio_base64=request.audio_base64,
             language=request.language,
         )
-        return DetectResponse(**result)
+        # Only the documented fields; a missing one is a server error
+        return ORJSONResponse({field: result[field] for field in _RESPONSE_FIELDS})
     
     except ValueError as e:
         # Validation/processing errors
         raise HTTPException(status_code=422, detail=str(e))
     
+    except Exception:
+        # Unexpected errors
+        logger.exception("Detection error")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "/detect/batch",
+    response_model=None,
+    responses={
+        200: {"model": DetectBatchResponse, "description": "Per-item results"},
+        401: {"model": ErrorResponse, "description": "Invalid API key"},
+        422: {"model": ErrorResponse, "description": "Invalid request body"},
+        500: {"model": ErrorResponse, "description": "Server error"},
+    },
+    summary="Detect AI-generated voice for several clips",
+    description=f"""
+    Analyze up to {settings.BATCH_MAX_ITEMS} audio clips in one request.
+    
+    **Authentication**: Requires `Authorization: Bearer <API_KEY>` header.
+    
+    **Input**: `items`, each shaped like a `/detect` request body.
+    
+    Clips are processed concurrently and their LLM calls are shared,
+    so a batch is much faster than the same number of `/detect` calls.
+    An item with missing or unreadable audio gets `{{"detail": ...}}`
+    in its slot; the other items are unaffected.
+    """,
+)
+async def detect_voice_batch(
+    request: DetectBatchRequest,
+    _: bool = Depends(verify_api_key),
+) -> ORJSONResponse:
+    """
+    Batch detection endpoint
+    
+    Same pipeline as /detect for every item; see
+    DetectController.detect_many.
+    """
+    try:
+        results = await controller.detect_many([item.dict() for item in request.items])
+        return ORJSONResponse({
+            "results": [
+                result if "detail" in result
+                else {field: result[field] for field in _RESPONSE_FIELDS}
+                for result in results
+            ]
+        })
+    
+    except ValueError as e:
+        # Validation/processing errors not tied to one item
+        raise HTTPException(status_code=422, detail=str(e))
+    
     except Exception as e:
         # Unexpected errors
-        print(f"Detection error: {e}")
+        logger.exception("Batch detection error: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
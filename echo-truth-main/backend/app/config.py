@@ -15,9 +15,14 @@ Create a .env file with:
 ============================================
 """
 
-import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from pydantic import BaseSettings
+
+try:
+    # Pydantic v2: BaseSettings moved to pydantic-settings
+    from pydantic_settings import BaseSettings
+except ImportError:
+    from pydantic import BaseSettings
 
 # Load environment variables from .env file
 load_dotenv()
@@ -27,6 +32,9 @@ class Settings(BaseSettings):
     """
     Application settings loaded from environment variables.
     
+    Each field is read from the env var of the same name
+    (or .env); the values below are only defaults.
+    
     ============================================
     API KEYS GO HERE (via environment variables)
     ============================================
@@ -36,7 +44,7 @@ class Settings(BaseSettings):
     # API_KEY: Used for authenticating requests
     # Generate a secure random string for production
     # ============================================
-    API_KEY: str = os.getenv("API_KEY", "demo-key-12345")
+    API_KEY: str = "demo-key-12345"
     
     # ============================================
     # LLM_API_KEY: Your LLM provider API key
@@ -45,28 +53,66 @@ class Settings(BaseSettings):
     #   - Google AI: https://makersuite.google.com/app/apikey
     #   - Groq: https://console.groq.com/keys
     # ============================================
-    LLM_API_KEY: str = os.getenv("LLM_API_KEY", "")
+    LLM_API_KEY: str = ""
     
     # ============================================
     # LLM_PROVIDER: Which LLM to use
     # Options: "openai" | "gemini" | "groq"
     # ============================================
-    LLM_PROVIDER: str = os.getenv("LLM_PROVIDER", "gemini")
+    LLM_PROVIDER: str = "gemini"
     
     # LLM Model settings
-    LLM_MODEL: str = os.getenv("LLM_MODEL", "gemini-1.5-flash")
+    LLM_MODEL: str = "gemini-1.5-flash"
+    
+    # Max concurrent LLM calls per worker (avoids provider 429s)
+    LLM_MAX_CONCURRENCY: int = 32
+    
+    # Micro-batching of concurrent LLM calls (max size 1 disables)
+    LLM_BATCH_MAX_SIZE: int = 16
+    LLM_BATCH_MAX_WAIT_MS: int = 20
     
     # Audio processing settings
     MAX_AUDIO_DURATION: int = 300  # 5 minutes max
-    TEMP_DIR: str = os.getenv("TEMP_DIR", "app/tmp")
+    
+    # Batch detection (/api/v1/detect/batch)
+    BATCH_MAX_ITEMS: int = 32
+    BATCH_CONCURRENCY: int = 8
+    
+    # LLM response cache settings
+    # Set REDIS_URL to share the cache across workers
+    LLM_CACHE_TTL: int = 3600
+    LLM_CACHE_MAX_SIZE: int = 1024
+    REDIS_URL: str = ""
+    
+    # Semantic cache: reuse a verdict for near-identical features
+    # (scaled L2 distance below the threshold; max size 0 disables)
+    SEMANTIC_CACHE_THRESHOLD: float = 0.05
+    SEMANTIC_CACHE_MAX_SIZE: int = 4096
+    
+    # Final result cache, keyed by sha256 of the audio bytes
+    RESULT_CACHE_TTL: int = 3600
+    RESULT_CACHE_MAX_SIZE: int = 1024
     
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance (built once)"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
+
+# Hot-path values as plain module constants
+# (no settings attribute lookup per request)
+API_KEY: str = settings.API_KEY
+API_KEY_BYTES: bytes = API_KEY.encode("utf-8")
+LLM_PROVIDER: str = settings.LLM_PROVIDER
+LLM_MODEL: str = settings.LLM_MODEL
 
 
 def validate_config():
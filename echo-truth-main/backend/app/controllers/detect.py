@@ -7,15 +7,28 @@ This is the main controller that coordinates:
 2. Feature extraction
 3. Classification decision
 4. Response formatting
+
+Results are cached by sha256 of the raw audio bytes + language,
+so repeated uploads skip the whole pipeline.
+
+detect_many runs the same pipeline for a batch of inputs.
 """
 
-import os
-import uuid
-from typing import Optional
+import asyncio
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple
 from app.services.audio_service import AudioService
 from app.services.decision_service import DecisionService
+from app.services.llm_cache import MemoryBackend
+from app.utils.validators import validate_feature_dict
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Process-wide cache of final results, keyed by audio hash + language
+RESULT_CACHE = MemoryBackend(max_size=settings.RESULT_CACHE_MAX_SIZE)
+
 
 class DetectController:
     """
@@ -23,15 +36,14 @@ class DetectController:
     
     Orchestrates the full detection flow:
     audio → features → decision → response
+    
+    Audio stays in memory; only the seekable-input fallback
+    (and downloads too large to spool in memory) touch disk.
     """
     
     def __init__(self):
         self.audio_service = AudioService()
         self.decision_service = DecisionService()
-        self.temp_dir = settings.TEMP_DIR
-        
-        # Ensure temp directory exists
-        os.makedirs(self.temp_dir, exist_ok=True)
     
     async def detect(
         self,
@@ -43,12 +55,11 @@ class DetectController:
         Main detection method
         
         Flow:
-        1. Download/decode audio to temp file
-        2. Convert to WAV mono 16kHz
+        1. Download/decode audio (cache lookup)
+        2. Convert to WAV mono 8kHz (ffmpeg pipe)
         3. Extract audio features
         4. Run classification
-        5. Clean up temp files
-        6. Return result
+        5. Return result
         
         Args:
             audio_url: URL to download audio from
@@ -61,42 +72,138 @@ class DetectController:
         Raises:
             ValueError: If audio processing fails
         """
-        temp_files = []
-        
-        try:
-            # Generate unique temp file names
-            file_id = str(uuid.uuid4())[:8]
-            input_path = os.path.join(self.temp_dir, f"{file_id}_input.mp3")
-            wav_path = os.path.join(self.temp_dir, f"{file_id}_processed.wav")
-            temp_files.extend([input_path, wav_path])
+        cache_key, cached, features = await self._load(audio_url, audio_base64, language)
+        if cached is not None:
+            return cached
+        
+        # Step 4: Run classification
+        result = await self.decision_service.classify(
+            features=features,
+            language=language,
+        )
+        
+        await self._cache_result(cache_key, result)
+        
+        return result
+    
+    async def detect_many(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run detection for several audio inputs
+        
+        Audio loading runs concurrently (bounded by
+        BATCH_CONCURRENCY); all items that need classifying are
+        then passed to DecisionService.classify_many together.
+        
+        Failures are per item: an item whose audio is invalid,
+        whose features break the feature contract, or whose
+        loading fails unexpectedly gets {"detail": ...} in its
+        slot and is left out of classification.
+        
+        Args:
+            items: Dicts with audio_url / audio_base64 / language
             
-            # Step 1: Get audio file
-            if audio_url:
-                await self.audio_service.download_audio(audio_url, input_path)
-            elif audio_base64:
-                await self.audio_service.decode_base64(audio_base64, input_path)
+        Returns:
+            One entry per item, in input order: the result dict,
+            or {"detail": ...} if that item failed
+        """
+        sem = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+        
+        async def load(item: Dict[str, Any]):
+            async with sem:
+                try:
+                    return await self._load(
+                        item.get("audio_url"),
+                        item.get("audio_base64"),
+                        item.get("language", "en"),
+                    )
+                except ValueError as e:
+                    return {"detail": str(e)}
+                except Exception as e:
+                    # Unexpected errors stay confined to this item
+                    logger.exception("Batch item failed: %s", e)
+                    return {"detail": "Internal server error"}
+        
+        loaded = await asyncio.gather(*(load(item) for item in items))
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        pending = []
+        for i, entry in enumerate(loaded):
+            if isinstance(entry, dict):
+                results[i] = entry
+            elif entry[1] is not None:
+                results[i] = entry[1]
+            elif not validate_feature_dict(entry[2]):
+                # classify_many rejects the whole batch on a contract violation
+                results[i] = {"detail": "Invalid audio features"}
             else:
-                raise ValueError("No audio provided")
-            
-            # Step 2: Convert to WAV mono 16kHz
-            await self.audio_service.convert_to_wav(input_path, wav_path)
-            
-            # Step 3: Extract features
-            features = await self.audio_service.extract_features(wav_path)
+                pending.append(i)
+        
+        classified = await self.decision_service.classify_many(
+            [(loaded[i][2], items[i].get("language", "en")) for i in pending]
+        )
+        for i, result in zip(pending, classified):
+            await self._cache_result(loaded[i][0], result)
+            results[i] = result
+        
+        return results
+    
+    async def _cache_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a final result in the result cache
+        
+        Heuristic fallbacks (LLM failed or unavailable) are not
+        stored, so a transient failure is retried on the next
+        request instead of being served for RESULT_CACHE_TTL.
+        """
+        if result.get("fallback"):
+            return
+        await RESULT_CACHE.set(cache_key, dict(result), settings.RESULT_CACHE_TTL)
+    
+    async def _load(
+        self,
+        audio_url: Optional[str],
+        audio_base64: Optional[str],
+        language: str,
+    ) -> Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """
+        Steps 1-3: get audio, check the result cache, extract features
+        
+        Returns:
+            (cache_key, cached_result, features); features is None
+            when a cached result was found
             
-            # Step 4: Run classification
-            result = await self.decision_service.classify(
-                features=features,
-                language=language,
-            )
+        Raises:
+            ValueError: If audio processing fails
+        """
+        # Step 1+2: Get audio and convert to WAV mono 8kHz
+        if audio_url:
+            # Download is streamed into ffmpeg, so decoding overlaps the
+            # transfer. The audio hash is only known once the download
+            # ends, so a cached URL still pays for the (overlapped) decode
+            # and skips only feature extraction and classification.
+            wav_bytes, audio_hash = await self.audio_service.download_to_wav_bytes(audio_url)
+            cache_key = f"{audio_hash}:{language}"
+            cached = await RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                return cache_key, dict(cached), None
+        elif audio_base64:
+            input_bytes = await self.audio_service.decode_base64(audio_base64)
             
-            return result
+            # Return cached result for audio we have already analyzed
+            cache_key = f"{hashlib.sha256(input_bytes).hexdigest()}:{language}"
+            cached = await RESULT_CACHE.get(cache_key)
+            if cached is not None:
+                return cache_key, dict(cached), None
             
-        finally:
-            # Step 5: Clean up temp files
-            for temp_file in temp_files:
-                try:
-                    if os.path.exists(temp_file):
-                        os.remove(temp_file)
-                except Exception as e:
-                    print(f"Warning: Failed to clean up {temp_file}: {e}")
+            wav_bytes = await self.audio_service.convert_to_wav_bytes(input_bytes)
+        else:
+            raise ValueError("No audio provided")
+        
+        # Step 3: Extract features
+        features = await self.audio_service.extract_features(wav_bytes)
+        return cache_key, None, features
+
+
+# Shared controller: the services hold no per-request state,
+# so one instance serves every request (no per-request setup)
+_CONTROLLER = DetectController()
@@ -4,6 +4,7 @@ FastAPI application entry point
 
 This is the main entry point for the EchoTruth backend.
 Run with: uvicorn app.main:app --reload
+Or:       python -m app.main  (uvloop + httptools, one worker per CPU)
 
 ============================================
 CONFIGURATION
@@ -17,7 +18,10 @@ Set your environment variables in .env file:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.api.v1 import router as api_v1_router
+from app.adapters.llm_adapter import close_client as close_llm_client
+from app.services.audio_service import close_client as close_download_client
 from app.config import settings
 
 # Create FastAPI application
@@ -27,29 +31,35 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # ============================================
 # CORS Configuration
-# Update origins for your production domains
+# Any origin is allowed (Vercel deployment). Auth uses a
+# Bearer header, not cookies, so credentials are off; a
+# single "*" also lets Starlette skip per-origin matching.
+# To restrict, replace "*" with your production domains.
 # ============================================
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",  # Vite dev server
-        "http://localhost:8080",
-        "*", # Allow all origins for Vercel deployment
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=["*"],
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # Include API routes
 app.include_router(api_v1_router, prefix="/api/v1")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Release pooled HTTP connections"""
+    await close_llm_client()
+    await close_download_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint - API info"""
@@ -71,5 +81,17 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    
+    # uvloop/httptools: C-backed event loop and HTTP parser
+    # workers > 1 needs the import string; in production prefer
+    # gunicorn -k uvicorn.workers.UvicornWorker (see docs/DEPLOY.md)
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
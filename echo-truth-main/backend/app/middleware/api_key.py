@@ -13,9 +13,10 @@ See config.py for configuration.
 ============================================
 """
 
+import hmac
 from fastapi import HTTPException, Request, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from app.config import settings
+from app.config import API_KEY_BYTES
 
 # HTTP Bearer security scheme
 security = HTTPBearer()
@@ -31,7 +32,7 @@ async def verify_api_key(
     AUTHENTICATION FLOW
     ============================================
     1. Extract token from "Authorization: Bearer <token>" header
-    2. Compare with API_KEY from environment
+    2. Compare with API_KEY from environment (constant time)
     3. Raise 401 if invalid
     ============================================
     
@@ -56,9 +57,10 @@ async def verify_api_key(
     # ============================================
     # API KEY COMPARISON
     # The expected API_KEY is loaded from config.py
-    # which reads from environment variables
+    # which reads from environment variables.
+    # hmac.compare_digest avoids leaking timing info.
     # ============================================
-    if token != settings.API_KEY:
+    if not token or not hmac.compare_digest(token.encode("utf-8"), API_KEY_BYTES):
         raise HTTPException(
             status_code=401,
             detail="Invalid API key",
@@ -14,12 +14,37 @@ Supported providers (via LLM_PROVIDER env var):
 - groq: Groq (Llama)
 
 API keys are loaded from config.py
+
+Concurrent requests are micro-batched into a single
+LLM call (see llm_batcher.py).
 ============================================
 """
 
-from typing import Dict, Any, Optional
+import logging
+import re
+import orjson
+from typing import Dict, Any, List, Optional
 from app.adapters.llm_adapter import LLMAdapter
-from app.utils.prompts import get_classification_prompt
+from app.services.llm_batcher import BatchHandler, BatchItem, LLMBatcher
+from app.utils.prompts import get_batch_classification_prompt, get_classification_prompt
+from app.utils.verdict import decode_verdict
+
+logger = logging.getLogger(__name__)
+
+# Single JSON object (no nesting) holding the classification field;
+# replies it cannot match fall back to the outermost {...} slice
+_RESULT_RE = re.compile(r'\{[^{}]*"classification"[^{}]*\}', re.S)
+
+# Process-wide batcher so concurrent requests share LLM calls
+_BATCHER: Optional[LLMBatcher] = None
+
+
+def _get_batcher(handler: BatchHandler) -> LLMBatcher:
+    """Return the shared LLMBatcher, creating it on first use"""
+    global _BATCHER
+    if _BATCHER is None:
+        _BATCHER = LLMBatcher(handler)
+    return _BATCHER
 
 
 class AIService:
@@ -49,19 +74,27 @@ class AIService:
             Dict with classification, confidence, explanation
             or None if LLM call fails
         """
-        # Build prompt with features
-        prompt = get_classification_prompt(features, language)
+        # Call LLM (batched with concurrent requests)
+        return await _get_batcher(self._classify_batch).submit(features, language)
+    
+    async def _classify_batch(self, items: List[BatchItem]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Classify a batch of (features, language) items with one LLM call
         
-        # Call LLM
-        response = await self.llm.generate(prompt)
+        A single item uses the regular single-object prompt.
+        """
+        if len(items) == 1:
+            features, language = items[0]
+            response = await self.llm.generate(get_classification_prompt(features, language))
+            return [self._parse_llm_response(response) if response else None]
         
-        if not response:
-            return None
+        prompt = get_batch_classification_prompt(items)
+        response = await self.llm.generate(prompt, max_tokens=300 * len(items))
         
-        # Parse response
-        result = self._parse_llm_response(response)
+        if not response:
+            return [None] * len(items)
         
-        return result
+        return self._parse_llm_batch_response(response, len(items))
     
     def _parse_llm_response(self, response: str) -> Optional[Dict[str, Any]]:
         """
@@ -74,53 +107,122 @@ class AIService:
             "explanation": "..."
         }
         """
-        import json
+        # Cheap substring check before any regex or JSON work
+        if '"classification"' not in response:
+            logger.warning("No JSON found in LLM response: %.100s", response)
+            return None
+        
+        # Fast path: flat JSON object containing the classification
+        # key, even when the LLM wraps it in extra text
+        match = _RESULT_RE.search(response)
+        if match is not None:
+            result = self._parse_json_object(match.group(0))
+            if result is not None:
+                return result
+        
+        # Braces inside a string value or a nested object defeat
+        # the regex; retry with the outermost {...} slice
+        start = response.find("{")
+        end = response.rfind("}") + 1
+        if start == -1 or end == 0:
+            logger.warning("No JSON found in LLM response: %.100s", response)
+            return None
+        
+        json_str = response[start:end]
+        if match is not None and json_str == match.group(0):
+            result = None  # already tried above
+        else:
+            result = self._parse_json_object(json_str)
+        if result is None:
+            logger.warning("Failed to parse LLM JSON: %.100s", json_str)
+        return result
+    
+    def _parse_json_object(self, json_str: str) -> Optional[Dict[str, Any]]:
+        """
+        Decode one JSON verdict object
+        
+        Returns:
+            Result dict, or None if it is not valid JSON or
+            cannot be normalized
+        """
+        # Strict: a well-formed verdict decodes and validates in one pass
+        result = decode_verdict(json_str)
+        if result is not None:
+            return result
+        
+        # Lenient path: fill defaults and normalize loose values
+        try:
+            result = orjson.loads(json_str)
+            return self._normalize_result(result)
+            
+        except orjson.JSONDecodeError as e:
+            logger.debug("Failed to parse LLM JSON: %s", e)
+            return None
+        except Exception as e:
+            logger.warning("Error parsing LLM response: %s", e)
+            return None
+    
+    def _parse_llm_batch_response(self, response: str, count: int) -> List[Optional[Dict[str, Any]]]:
+        """
+        Parse a batched LLM response (JSON array, one object per item)
         
+        Items that are missing or malformed come back as None.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * count
         try:
-            # Try to extract JSON from response
-            # Handle cases where LLM adds extra text
             response = response.strip()
             
-            # Find JSON object in response
-            start = response.find("{")
-            end = response.rfind("}") + 1
+            # Find JSON array in response
+            start = response.find("[")
+            end = response.rfind("]") + 1
             
             if start == -1 or end == 0:
-                print(f"No JSON found in LLM response: {response[:100]}")
-                return None
-            
-            json_str = response[start:end]
-            result = json.loads(json_str)
+                logger.warning("No JSON array found in LLM response: %.100s", response)
+                return results
             
-            # Validate required fields
-            if "classification" not in result:
-                return None
-            if "confidence" not in result:
-                result["confidence"] = 0.7
-            if "explanation" not in result:
-                result["explanation"] = "Classification based on audio feature analysis."
+            items = orjson.loads(response[start:end])
+            if not isinstance(items, list):
+                return results
+            if len(items) != count:
+                logger.warning("LLM batch returned %d results for %d items", len(items), count)
             
-            # Normalize classification value
-            classification = result["classification"].upper().replace(" ", "_")
-            if classification not in ["AI_GENERATED", "HUMAN"]:
-                if "AI" in classification or "SYNTHETIC" in classification:
-                    classification = "AI_GENERATED"
-                else:
-                    classification = "HUMAN"
-            result["classification"] = classification
+            for i, item in enumerate(items[:count]):
+                try:
+                    results[i] = self._normalize_result(item)
+                except Exception as e:
+                    logger.warning("Error parsing LLM batch item %d: %s", i, e)
             
-            # Ensure confidence is float
-            result["confidence"] = float(result["confidence"])
-            result["confidence"] = max(0.0, min(1.0, result["confidence"]))
-            
-            # Truncate explanation
-            result["explanation"] = str(result["explanation"])[:240]
-            
-            return result
-            
-        except json.JSONDecodeError as e:
-            print(f"Failed to parse LLM JSON: {e}")
-            return None
-        except Exception as e:
-            print(f"Error parsing LLM response: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning("Failed to parse LLM JSON: %s", e)
+        
+        return results
+    
+    def _normalize_result(self, result: Any) -> Optional[Dict[str, Any]]:
+        """
+        Fill defaults and normalize one parsed LLM result
+        """
+        # Validate required fields
+        if not isinstance(result, dict) or "classification" not in result:
             return None
+        if "confidence" not in result:
+            result["confidence"] = 0.7
+        if "explanation" not in result:
+            result["explanation"] = "Classification based on audio feature analysis."
+        
+        # Normalize classification value
+        classification = result["classification"].upper().replace(" ", "_")
+        if classification not in ["AI_GENERATED", "HUMAN"]:
+            if "AI" in classification or "SYNTHETIC" in classification:
+                classification = "AI_GENERATED"
+            else:
+                classification = "HUMAN"
+        result["classification"] = classification
+        
+        # Ensure confidence is float
+        result["confidence"] = float(result["confidence"])
+        result["confidence"] = max(0.0, min(1.0, result["confidence"]))
+        
+        # Truncate explanation
+        result["explanation"] = str(result["explanation"])[:240]
+        
+        return result
@@ -3,25 +3,71 @@ audio_service.py
 Audio processing service
 
 Handles:
-- Downloading audio from URLs
+- Downloading audio from URLs (streamed into ffmpeg)
 - Decoding base64 audio
-- Converting audio to WAV (mono 16kHz)
+- Converting audio to WAV (mono 8kHz)
 - Extracting audio features using librosa
 
 Dependencies:
-- requests: HTTP downloads
-- ffmpeg-python: Audio conversion
+- httpx: Async HTTP downloads
+- ffmpeg (binary): Audio conversion
 - librosa: Feature extraction
 - numpy: Numerical operations
+- numba: Pitch / RMS kernels (utils/pitch_numba.py, utils/rms_numba.py)
+
+Blocking work (librosa) runs in a worker thread via
+asyncio.to_thread so the event loop stays free.
 """
 
-import os
-import base64
-import requests
-import ffmpeg
+import io
+import asyncio
+import binascii
+import hashlib
+import logging
+import shutil
+import tempfile
+import httpx
 import librosa
 import numpy as np
-from typing import Dict, Any
+from typing import BinaryIO, Dict, Any, Optional, Tuple
+from app.utils.pitch_numba import frame_pitch_variance
+from app.utils.rms_numba import rms_stats
+from app.utils.validators import MAX_B64_CHARS, strip_data_url_prefix
+
+logger = logging.getLogger(__name__)
+
+# Shared download client, created on first use
+# Closed on app shutdown (see main.py)
+_HTTPX: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared download client"""
+    global _HTTPX
+    if _HTTPX is None or _HTTPX.is_closed:
+        _HTTPX = httpx.AsyncClient(
+            headers={"User-Agent": "EchoTruth/1.0 (Audio Analyzer)"},
+            timeout=30.0,
+            follow_redirects=True,
+        )
+    return _HTTPX
+
+
+async def close_client() -> None:
+    """Close the shared download client (called on app shutdown)"""
+    global _HTTPX
+    if _HTTPX is not None:
+        await _HTTPX.aclose()
+    _HTTPX = None
+
+
+async def _read_all(stream: asyncio.StreamReader, sink: bytearray) -> None:
+    """Read a subprocess pipe to EOF into sink"""
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        sink.extend(chunk)
 
 
 class AudioService:
@@ -31,7 +77,7 @@ class AudioService:
     All audio is converted to:
     - Format: WAV
     - Channels: Mono
-    - Sample rate: 16000 Hz
+    - Sample rate: 8000 Hz
     
     This ensures consistent feature extraction.
     """
@@ -39,106 +85,240 @@ class AudioService:
     # Supported audio formats
     SUPPORTED_FORMATS = {".mp3", ".wav", ".ogg", ".m4a", ".webm", ".flac"}
     
-    # Target sample rate for processing
-    TARGET_SAMPLE_RATE = 16000
+    # Target sample rate for processing. Features only need
+    # content below 4 kHz (see docs/adr/001-feature-sample-rate.md)
+    TARGET_SAMPLE_RATE = 8000
+    
+    # Pitch search range (C2-C7), computed once
+    PITCH_FMIN = librosa.note_to_hz('C2')  # ~65 Hz
+    PITCH_FMAX = librosa.note_to_hz('C7')  # ~2093 Hz
+    # Analysis framing shared by the RMS and pitch kernels
+    # (128 ms frames, 32 ms hop at 8 kHz)
+    PITCH_FRAME_LENGTH = 1024
+    PITCH_HOP_LENGTH = 256
+    
+    # Minimum normalized autocorrelation peak for a voiced frame
+    PITCH_VOICING = 0.3
+    
+    # Base64 payloads larger than this (chars) decode off the event loop
+    BASE64_THREAD_THRESHOLD = 1024 * 1024
     
-    async def download_audio(self, url: str, output_path: str) -> None:
+    # Downloads are kept for the seekable-input fallback in
+    # memory up to this size (bytes), then spooled to disk
+    DOWNLOAD_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
+    
+    async def download_to_wav_bytes(self, url: str) -> Tuple[bytes, str]:
         """
-        Download audio file from URL
+        Download audio from URL and convert it to WAV while streaming
+        
+        Downloaded chunks are written straight into ffmpeg's stdin
+        while its stdout is read concurrently, so decoding overlaps
+        the network transfer instead of waiting for it. A copy
+        of the download is spooled for the seekable-input
+        fallback: in memory up to DOWNLOAD_SPOOL_MAX_MEMORY, on
+        disk beyond that.
         
         Args:
             url: HTTP/HTTPS URL to audio file
-            output_path: Local path to save file
+            
+        Returns:
+            (WAV file bytes, sha256 hex digest of the downloaded audio)
             
         Raises:
-            ValueError: If download fails or URL is invalid
+            ValueError: If download or conversion fails
         """
-        try:
-            # Set timeout and user agent for reliable downloads
-            headers = {
-                "User-Agent": "EchoTruth/1.0 (Audio Analyzer)"
-            }
-            response = requests.get(url, headers=headers, timeout=30, stream=True)
-            response.raise_for_status()
-            
-            # Check content type
-            content_type = response.headers.get("Content-Type", "")
-            if not ("audio" in content_type or "octet-stream" in content_type):
-                print(f"Warning: Unexpected content type: {content_type}")
-            
-            # Save to file
-            with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+        proc = await self._spawn_ffmpeg("pipe:0", stdin=asyncio.subprocess.PIPE)
+        
+        digest = hashlib.sha256()
+        # Kept for the seekable-input fallback
+        downloaded = tempfile.SpooledTemporaryFile(max_size=self.DOWNLOAD_SPOOL_MAX_MEMORY)
+        wav_buffer = bytearray()
+        err_buffer = bytearray()
+        
+        async def _pump_download() -> None:
+            pipe_open = True
+            spooled = 0
+            try:
+                async with _get_client().stream("GET", url) as response:
+                    response.raise_for_status()
+                    
+                    # Check content type
+                    content_type = response.headers.get("Content-Type", "")
+                    if not ("audio" in content_type or "octet-stream" in content_type):
+                        logger.warning("Unexpected content type: %s", content_type)
                     
-        except requests.RequestException as e:
-            raise ValueError(f"Failed to download audio: {str(e)}")
+                    async for chunk in response.aiter_bytes(65536):
+                        digest.update(chunk)
+                        spooled += len(chunk)
+                        if spooled > self.DOWNLOAD_SPOOL_MAX_MEMORY:
+                            # Rolled over (or rolling over) to disk: write off the loop
+                            await asyncio.to_thread(downloaded.write, chunk)
+                        else:
+                            downloaded.write(chunk)
+                        if pipe_open:
+                            try:
+                                proc.stdin.write(chunk)
+                                await proc.stdin.drain()
+                            except (BrokenPipeError, ConnectionResetError):
+                                # ffmpeg gave up early; keep downloading for the fallback
+                                pipe_open = False
+            finally:
+                if not proc.stdin.is_closing():
+                    proc.stdin.close()
+        
+        with downloaded:
+            try:
+                await asyncio.gather(
+                    _pump_download(),
+                    _read_all(proc.stdout, wav_buffer),
+                    _read_all(proc.stderr, err_buffer),
+                )
+                await proc.wait()
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                # InvalidURL (malformed URL) is not an HTTPError subclass
+                raise ValueError(f"Failed to download audio: {str(e)}")
+            finally:
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+            
+            if proc.returncode == 0 and wav_buffer:
+                return bytes(wav_buffer), digest.hexdigest()
+            
+            # Some containers cannot be decoded from a pipe
+            wav_bytes = await self._convert_from_tempfile(downloaded, bytes(err_buffer))
+            return wav_bytes, digest.hexdigest()
     
-    async def decode_base64(self, base64_data: str, output_path: str) -> None:
+    async def decode_base64(self, base64_data: str) -> bytes:
         """
-        Decode base64 audio data and save to file
+        Decode base64 audio data
         
         Args:
-            base64_data: Base64 encoded audio (without data URL prefix)
-            output_path: Local path to save decoded file
+            base64_data: Base64 encoded audio (data URL prefix allowed)
+            
+        Returns:
+            Raw audio bytes
             
         Raises:
-            ValueError: If decoding fails
+            ValueError: If the payload is too large or decoding fails
         """
+        # Reject oversized payloads before scanning them
+        if len(base64_data) > MAX_B64_CHARS:
+            raise ValueError("Base64 audio too large")
+        
         try:
-            # Remove data URL prefix if present
-            if "," in base64_data:
-                base64_data = base64_data.split(",")[1]
-            
-            # Decode and save
-            audio_bytes = base64.b64decode(base64_data)
-            with open(output_path, "wb") as f:
-                f.write(audio_bytes)
+            # Remove data URL prefix if present (same rule as the validator)
+            payload = strip_data_url_prefix(base64_data)
+            
+            # Large payloads decode in a worker thread
+            if len(payload) > self.BASE64_THREAD_THRESHOLD:
+                return await asyncio.to_thread(binascii.a2b_base64, payload)
+            return binascii.a2b_base64(payload)
                 
         except Exception as e:
             raise ValueError(f"Failed to decode base64 audio: {str(e)}")
     
-    async def convert_to_wav(self, input_path: str, output_path: str) -> None:
+    async def convert_to_wav_bytes(self, input_bytes: bytes) -> bytes:
         """
-        Convert audio to WAV mono 16kHz using ffmpeg
+        Convert audio to WAV mono 8kHz using ffmpeg
+        
+        Audio is piped through ffmpeg's stdin/stdout, so nothing
+        touches the disk. Containers that need a seekable input
+        (e.g. M4A with a trailing moov atom) are retried from a
+        temporary file.
         
         Args:
-            input_path: Path to input audio file
-            output_path: Path for output WAV file
+            input_bytes: Raw input audio
+            
+        Returns:
+            WAV file bytes
             
         Raises:
             ValueError: If conversion fails
         """
+        returncode, wav_bytes, stderr = await self._run_ffmpeg("pipe:0", input_bytes)
+        
+        if returncode == 0 and wav_bytes:
+            return wav_bytes
+        
+        return await self._convert_from_tempfile(io.BytesIO(input_bytes), stderr)
+    
+    async def _convert_from_tempfile(self, source: BinaryIO, pipe_stderr: bytes) -> bytes:
+        """
+        Retry conversion from a seekable temporary file
+        
+        Args:
+            source: File object holding the input audio; copied
+                from its start in chunks (off the event loop)
+            pipe_stderr: ffmpeg stderr of the failed pipe attempt
+        
+        Raises:
+            ValueError: If conversion fails
+        """
+        with tempfile.NamedTemporaryFile() as f:
+            source.seek(0)
+            await asyncio.to_thread(shutil.copyfileobj, source, f)
+            f.flush()
+            returncode, wav_bytes, stderr = await self._run_ffmpeg(f.name, None)
+        
+        if returncode != 0 or not wav_bytes:
+            stderr = stderr or pipe_stderr
+            error_msg = stderr.decode(errors="replace") if stderr else f"exit code {returncode}"
+            raise ValueError(f"Audio conversion failed: {error_msg}")
+        
+        return wav_bytes
+    
+    async def _spawn_ffmpeg(self, source: str, stdin: int) -> asyncio.subprocess.Process:
+        """Start the ffmpeg conversion pipeline writing WAV to stdout"""
         try:
-            # FFmpeg conversion pipeline
-            (
-                ffmpeg
-                .input(input_path)
-                .output(
-                    output_path,
-                    acodec="pcm_s16le",  # 16-bit PCM
-                    ac=1,                 # Mono
-                    ar=self.TARGET_SAMPLE_RATE,  # 16kHz
-                )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+            return await asyncio.create_subprocess_exec(
+                "ffmpeg", "-hide_banner", "-loglevel", "error",
+                "-i", source,
+                "-f", "wav",
+                "-acodec", "pcm_s16le",              # 16-bit PCM
+                "-ac", "1",                          # Mono
+                "-ar", str(self.TARGET_SAMPLE_RATE), # 8kHz
+                "pipe:1",
+                stdin=stdin,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-        except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
-            raise ValueError(f"Audio conversion failed: {error_msg}")
+        except FileNotFoundError:
+            raise ValueError("Audio conversion failed: ffmpeg is not installed")
+    
+    async def _run_ffmpeg(self, source: str, input_bytes: Optional[bytes]):
+        """
+        Run the ffmpeg conversion pipeline, returning
+        (returncode, stdout, stderr)
+        """
+        proc = await self._spawn_ffmpeg(
+            source,
+            stdin=asyncio.subprocess.PIPE if input_bytes is not None else asyncio.subprocess.DEVNULL,
+        )
+        stdout, stderr = await proc.communicate(input_bytes)
+        return proc.returncode, stdout, stderr
     
-    async def extract_features(self, wav_path: str) -> Dict[str, Any]:
+    async def extract_features(self, wav_bytes: bytes) -> Dict[str, Any]:
         """
         Extract audio features for classification
         
+        Runs librosa in a worker thread; see _extract_features_sync.
+        """
+        return await asyncio.to_thread(self._extract_features_sync, wav_bytes)
+    
+    def _extract_features_sync(self, wav_bytes: bytes) -> Dict[str, Any]:
+        """
+        Extract audio features for classification (blocking)
+        
         Features extracted:
         - duration: Length in seconds
         - silence_ratio: Proportion of silence in audio
         - avg_volume: Average RMS volume
         - pitch_variance: Variance in fundamental frequency (F0)
+        - sample_rate: Rate the features were computed at (provenance)
         
         Args:
-            wav_path: Path to WAV file (mono 16kHz)
+            wav_bytes: WAV file bytes (mono 8kHz)
             
         Returns:
             Dict with extracted features
@@ -148,43 +328,43 @@ class AudioService:
         """
         try:
             # Load audio
-            y, sr = librosa.load(wav_path, sr=self.TARGET_SAMPLE_RATE)
+            y, sr = librosa.load(
+                io.BytesIO(wav_bytes), sr=self.TARGET_SAMPLE_RATE, dtype=np.float32
+            )
+            # Kernels take contiguous float32; no-op when already so
+            y = np.ascontiguousarray(y, dtype=np.float32)
             
             # Duration
             duration = librosa.get_duration(y=y, sr=sr)
             
-            # RMS (volume/energy)
-            rms = librosa.feature.rms(y=y)[0]
-            avg_volume = float(np.mean(rms))
-            
-            # Silence detection
+            # RMS (volume/energy) and silence detection in one fused pass
             # Frames below 10% of max RMS are considered silence
-            silence_threshold = np.max(rms) * 0.1
-            silence_frames = np.sum(rms < silence_threshold)
-            silence_ratio = float(silence_frames / len(rms)) if len(rms) > 0 else 0.0
-            
-            # Pitch (F0) using pyin
-            f0, voiced_flag, voiced_probs = librosa.pyin(
-                y, 
-                fmin=librosa.note_to_hz('C2'),  # ~65 Hz
-                fmax=librosa.note_to_hz('C7'),  # ~2093 Hz
-                sr=sr,
+            avg_volume, max_rms, silence_ratio = rms_stats(
+                y, self.PITCH_FRAME_LENGTH, self.PITCH_HOP_LENGTH, 0.1
             )
+            silence_threshold = max_rms * 0.1
             
-            # Calculate pitch variance (only on voiced frames)
-            voiced_f0 = f0[~np.isnan(f0)]
-            if len(voiced_f0) > 1:
-                pitch_variance = float(np.var(voiced_f0))
-                # Normalize pitch variance to 0-1 range (heuristic)
-                pitch_variance = min(pitch_variance / 10000, 1.0)
-            else:
-                pitch_variance = 0.0
+            # Pitch variance via the Numba autocorrelation kernel
+            # Only the variance is needed, so no full pitch tracker
+            raw_variance = frame_pitch_variance(
+                y,
+                sr,
+                self.PITCH_FRAME_LENGTH,
+                self.PITCH_HOP_LENGTH,
+                self.PITCH_FMIN,
+                self.PITCH_FMAX,
+                float(silence_threshold),
+                self.PITCH_VOICING,
+            )
+            # Normalize pitch variance to 0-1 range (heuristic)
+            pitch_variance = min(float(raw_variance) / 10000, 1.0)
             
             return {
                 "duration": round(duration, 2),
-                "silence_ratio": round(silence_ratio, 4),
-                "avg_volume": round(avg_volume, 6),
+                "silence_ratio": round(float(silence_ratio), 4),
+                "avg_volume": round(float(avg_volume), 6),
                 "pitch_variance": round(pitch_variance, 4),
+                "sample_rate": sr,
             }
             
         except Exception as e:
@@ -5,14 +5,61 @@ Classification decision service
 Makes the final AI vs Human classification decision.
 Uses LLM for reasoning with heuristic fallback.
 
-Flow:
-1. Try LLM-based classification
-2. If LLM fails → use heuristic fallback
-3. Return standardized result
+Flow (classify; classify_many runs it for a batch):
+1. Score heuristics; clear-cut cases skip the LLM
+2. Return a cached verdict for identical features
+3. Reuse a verdict for near-identical features
+4. Try LLM-based classification
+5. If LLM fails → use heuristic fallback
+6. Return standardized result
 """
 
-from typing import Dict, Any
+import logging
+import asyncio
+import numpy as np
+from typing import Dict, Any, List, Optional, Tuple
+from app.config import settings
 from app.services.ai_service import AIService
+from app.services.llm_cache import LLMCache
+from app.services.semantic_cache import SemanticCache
+from app.utils.features import FeatureRecord
+from app.utils.heuristic_numba import (
+    AI_SCORE_THRESHOLD,
+    MASK_SCORES,
+    PITCH_VARIANCE_MAX,
+    SILENCE_RATIO_MAX,
+    VOLUME_MAX,
+    VOLUME_MIN,
+    heuristic_masks,
+)
+from app.utils.validators import validate_feature_dict
+from app.utils.verdict import is_valid_verdict
+
+logger = logging.getLogger(__name__)
+
+# Confidence multiplier for verdicts reused from a near match
+SEMANTIC_HIT_CONFIDENCE = 0.95
+
+# Heuristic scores this extreme are trusted without the LLM
+HEURISTIC_SURE_AI = 0.9
+HEURISTIC_SURE_HUMAN = 0.05
+HEURISTIC_SURE_CONFIDENCE = 0.9
+
+# Heuristic explanation strings, rendered once at import.
+# AI explanations are keyed by the 3-bit mask of fired rules.
+_RULE_REASONS = (
+    (4, "consistent pitch patterns"),
+    (2, "minimal natural pauses"),
+    (1, "normalized volume levels"),
+)
+_AI_EXPLANATIONS = {
+    mask: (
+        f"Audio shows {', '.join(r for bit, r in _RULE_REASONS if mask & bit) or 'synthetic characteristics'}. "
+        "Features suggest machine-generated speech patterns."
+    )[:240]
+    for mask in range(8)
+}
+_HUMAN_EXPLANATION = "Audio exhibits natural variations in pitch and rhythm consistent with authentic human speech patterns."
 
 
 class DecisionService:
@@ -25,6 +72,9 @@ class DecisionService:
     
     def __init__(self):
         self.ai_service = AIService()
+        self.cache = LLMCache()
+        self.semantic_cache = SemanticCache()
+        self._inflight: Dict[str, asyncio.Future] = {}
     
     async def classify(
         self,
@@ -34,6 +84,11 @@ class DecisionService:
         """
         Classify audio as AI-generated or human
         
+        Features must come from mono audio downsampled to at
+        most 8 kHz, carrying a `sample_rate` provenance key (see
+        docs/adr/001-feature-sample-rate.md). The heuristic
+        thresholds and the LLM prompt assume that contract.
+        
         Args:
             features: Extracted audio features
             language: Audio language code
@@ -43,43 +98,163 @@ class DecisionService:
             - classification: "AI_GENERATED" | "HUMAN"
             - confidence: float 0.0-1.0
             - explanation: str (max 240 chars)
+            - fallback: True, only when the LLM failed or was
+              unavailable and the heuristic verdict was used
+            
+        Raises:
+            ValueError: If the features break the feature contract
+        """
+        if not validate_feature_dict(features):
+            raise ValueError("Invalid audio features")
+        
+        heuristic, ai_score = self._heuristic_classify(FeatureRecord.from_dict(features))
+        return await self._decide(features, language, heuristic, ai_score)
+    
+    async def classify_many(
+        self,
+        items: List[Tuple[Dict[str, Any], str]],
+        concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Classify many feature sets concurrently
+        
+        Heuristics are scored for the whole batch in one pass;
+        the remaining items run the cache/LLM path concurrently,
+        at most `concurrency` at a time (the LLM batcher merges
+        them into shared calls). Identical (features, language)
+        items are classified once.
+        
+        Args:
+            items: List of (features, language) tuples
+            concurrency: Max items in flight (default BATCH_CONCURRENCY)
+            
+        Returns:
+            One result dict per item, in input order (shaped as
+            for classify, including the fallback marker)
+            
+        Raises:
+            ValueError: If any item breaks the feature contract
+        """
+        if not items:
+            return []
+        
+        if not all(validate_feature_dict(features) for features, _ in items):
+            raise ValueError("Invalid audio features")
+        
+        heuristics, scores = self._heuristic_classify_batch(
+            [FeatureRecord.from_dict(features) for features, _ in items]
+        )
+        sem = asyncio.Semaphore(concurrency or settings.BATCH_CONCURRENCY)
+        
+        # First index of each distinct cache key
+        keys = [self.cache.make_key(features, language) for features, language in items]
+        first: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            first.setdefault(key, i)
+        
+        async def one(i: int) -> Dict[str, Any]:
+            features, language = items[i]
+            async with sem:
+                return await self._decide(features, language, heuristics[i], float(scores[i]), keys[i])
+        
+        unique = await asyncio.gather(*(one(i) for i in first.values()))
+        by_key = dict(zip(first.keys(), unique))
+        return [dict(by_key[key]) for key in keys]
+    
+    async def _decide(
+        self,
+        features: Dict[str, Any],
+        language: str,
+        heuristic: Dict[str, Any],
+        ai_score: float,
+        cache_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Pick the final verdict given the precomputed heuristic
+        
+        Clear-cut heuristics return directly; otherwise caches,
+        then the LLM, with the heuristic as the fallback.
+        """
+        # All rules agree (or none fire): the LLM would add nothing
+        if ai_score >= HEURISTIC_SURE_AI or ai_score <= HEURISTIC_SURE_HUMAN:
+            heuristic["confidence"] = HEURISTIC_SURE_CONFIDENCE
+            return heuristic
+        
+        # Identical features (re-uploads, retries) skip the LLM
+        if cache_key is None:
+            cache_key = self.cache.make_key(features, language)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Near-identical features reuse a prior verdict, with
+        # confidence reduced to reflect the approximation
+        similar = self.semantic_cache.get(features, language)
+        if similar is not None:
+            similar["confidence"] = round(similar["confidence"] * SEMANTIC_HIT_CONFIDENCE, 4)
+            return similar
+        
+        # Concurrent identical requests share one LLM call
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            # Shielded so a cancelled waiter does not cancel the others
+            result = await asyncio.shield(inflight)
+        else:
+            inflight = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = inflight
+            result = None
+            try:
+                result = await self._classify_with_llm(features, language, cache_key)
+            finally:
+                # Waiters fall back to heuristics if this call is cancelled
+                if not inflight.done():
+                    inflight.set_result(result)
+                del self._inflight[cache_key]
+        
+        if result is not None:
+            return dict(result)
+        
+        # Fallback to heuristic classification (already computed),
+        # marked so callers do not cache a transient LLM failure
+        heuristic["fallback"] = True
+        return heuristic
+    
+    async def _classify_with_llm(
+        self,
+        features: Dict[str, Any],
+        language: str,
+        cache_key: str,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run the LLM path and cache a validated verdict
+        
+        Returns:
+            Validated result dict, or None to use the fallback
         """
         try:
             # Try LLM-based classification
             result = await self.ai_service.classify_with_llm(features, language)
             
             if result and self._validate_result(result):
+                # Only validated LLM verdicts are cached
+                await self.cache.set(cache_key, result)
+                self.semantic_cache.add(features, language, result)
                 return result
             
         except Exception as e:
-            print(f"LLM classification failed, using fallback: {e}")
+            logger.warning("LLM classification failed, using fallback: %s", e)
         
-        # Fallback to heuristic classification
-        return self._heuristic_classify(features)
+        return None
     
     def _validate_result(self, result: Dict[str, Any]) -> bool:
         """
         Validate LLM result has required fields and valid values
-        """
-        if not isinstance(result, dict):
-            return False
-        
-        classification = result.get("classification")
-        confidence = result.get("confidence")
-        explanation = result.get("explanation")
         
-        if classification not in ["AI_GENERATED", "HUMAN"]:
-            return False
-        
-        if not isinstance(confidence, (int, float)) or not (0 <= confidence <= 1):
-            return False
-        
-        if not isinstance(explanation, str) or len(explanation) == 0:
-            return False
-        
-        return True
+        Checked against the LLMVerdict schema (utils/verdict.py).
+        """
+        return is_valid_verdict(result)
     
-    def _heuristic_classify(self, features: Dict[str, Any]) -> Dict[str, Any]:
+    def _heuristic_classify(self, features: FeatureRecord) -> Tuple[Dict[str, Any], float]:
         """
         Fallback heuristic classification
         
@@ -99,43 +274,88 @@ class DecisionService:
         
         These thresholds are tuned heuristics, not ML predictions.
         Confidence is set low (0.55) to indicate uncertainty.
-        """
-        pitch_variance = features.get("pitch_variance", 0.5)
-        silence_ratio = features.get("silence_ratio", 0.1)
-        avg_volume = features.get("avg_volume", 0.05)
+        They assume features computed on mono audio at <= 8 kHz
+        (docs/adr/001-feature-sample-rate.md).
         
-        # Heuristic scoring
-        ai_score = 0.0
-        reasons = []
+        Returns:
+            (result dict, ai_score)
+        """
+        # Heuristic scoring: mask of fired rules (bit 2 → 0), and
+        # the score as its dot product with the rule weights
+        mask = 0
         
         # Low pitch variance suggests AI
-        if pitch_variance < 0.15:
-            ai_score += 0.4
-            reasons.append("consistent pitch patterns")
+        if features.pitch_variance < PITCH_VARIANCE_MAX:
+            mask |= 4
         
         # Low silence ratio suggests AI
-        if silence_ratio < 0.05:
-            ai_score += 0.3
-            reasons.append("minimal natural pauses")
+        if features.silence_ratio < SILENCE_RATIO_MAX:
+            mask |= 2
         
         # Very consistent volume suggests AI
-        if 0.03 < avg_volume < 0.08:
-            ai_score += 0.2
-            reasons.append("normalized volume levels")
+        if VOLUME_MIN < features.avg_volume < VOLUME_MAX:
+            mask |= 1
+        
+        ai_score = float(MASK_SCORES[mask])
         
-        # Make decision
-        if ai_score >= 0.5:
+        # Make decision (explanations are pre-rendered, max 240 chars)
+        if ai_score >= AI_SCORE_THRESHOLD:
             classification = "AI_GENERATED"
-            explanation = f"Audio shows {', '.join(reasons) or 'synthetic characteristics'}. Features suggest machine-generated speech patterns."
+            explanation = _AI_EXPLANATIONS[mask]
         else:
             classification = "HUMAN"
-            explanation = "Audio exhibits natural variations in pitch and rhythm consistent with authentic human speech patterns."
+            explanation = _HUMAN_EXPLANATION
         
         # Low confidence for heuristic fallback
         confidence = 0.55
         
-        return {
+        result = {
             "classification": classification,
             "confidence": confidence,
-            "explanation": explanation[:240],  # Ensure max 240 chars
+            "explanation": explanation,
         }
+        return result, ai_score
+    
+    def _heuristic_classify_batch(
+        self,
+        features_list: List[FeatureRecord],
+    ) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+        """
+        Vectorized _heuristic_classify for many feature records
+        
+        Same rules and results as _heuristic_classify, but all
+        items' rules are evaluated by one compiled pass over the
+        feature columns and scored by table lookup (see
+        utils/heuristic_numba.py).
+        
+        Returns:
+            (result dicts, ai_score array), parallel to the input
+        """
+        if not features_list:
+            return [], np.empty(0, dtype=np.float64)
+        
+        # (3, B) so each feature column is a contiguous row
+        pv, sr, av = np.array(
+            [
+                [f.pitch_variance for f in features_list],
+                [f.silence_ratio for f in features_list],
+                [f.avg_volume for f in features_list],
+            ],
+            dtype=np.float64,
+        )
+        
+        rules = np.empty(len(features_list), dtype=np.int8)
+        heuristic_masks(pv, sr, av, rules)
+        scores = MASK_SCORES[rules]
+        is_ai = scores >= AI_SCORE_THRESHOLD
+        
+        results = [
+            {
+                "classification": "AI_GENERATED" if ai else "HUMAN",
+                "confidence": 0.55,
+                "explanation": _AI_EXPLANATIONS[mask] if ai else _HUMAN_EXPLANATION,
+            }
+            for ai, mask in zip(is_ai.tolist(), rules.tolist())
+        ]
+        
+        return results, scores
@@ -0,0 +1,103 @@
+"""
+llm_batcher.py
+Micro-batching for LLM classification calls
+
+Requests that arrive within a short window are collected
+and sent to the LLM as a single prompt, so under bursty
+load one round-trip serves the whole batch.
+
+============================================
+TUNING (via environment variables)
+============================================
+- LLM_BATCH_MAX_SIZE: Max items per LLM call (default 16, 1 disables)
+- LLM_BATCH_MAX_WAIT_MS: Collection window in ms (default 20)
+============================================
+"""
+
+import logging
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# One queued request: features, language
+BatchItem = Tuple[Dict[str, Any], str]
+BatchHandler = Callable[[List[BatchItem]], Awaitable[List[Optional[Dict[str, Any]]]]]
+
+
+class LLMBatcher:
+    """
+    Collects concurrent classification requests into batches
+
+    The handler receives a list of (features, language) items
+    and must return results in the same order (None = failed).
+    """
+
+    def __init__(
+        self,
+        handler: BatchHandler,
+        max_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+    ):
+        self.handler = handler
+        self.max_size = max_size if max_size is not None else settings.LLM_BATCH_MAX_SIZE
+        self.max_wait = max_wait if max_wait is not None else settings.LLM_BATCH_MAX_WAIT_MS / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, features: Dict[str, Any], language: str) -> Optional[Dict[str, Any]]:
+        """
+        Queue one request and wait for its result
+
+        Returns:
+            Parsed result dict, or None if the LLM call failed
+        """
+        if self.max_size <= 1:
+            results = await self.handler([(features, language)])
+            return results[0]
+
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, language, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start the background collector on first use"""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+
+    async def _collect(self) -> None:
+        """Gather items until the batch is full or the window closes"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking collection of the next batch
+            task = asyncio.create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        """Run the handler and resolve each waiter's future"""
+        try:
+            results = await self.handler([(features, language) for features, language, _ in batch])
+        except Exception as e:
+            logger.warning("LLM batch failed: %s", e)
+            results = []
+
+        for i, (_, _, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(results[i] if i < len(results) else None)
@@ -0,0 +1,160 @@
+"""
+llm_cache.py
+LLM response cache
+
+Caches parsed LLM classification results so identical
+feature sets skip the LLM round-trip entirely.
+
+============================================
+CACHE BACKENDS
+============================================
+- memory: In-process LRU (default, no extra dependencies)
+- redis:  Shared cache across workers (set REDIS_URL)
+============================================
+"""
+
+import logging
+import time
+import hashlib
+import orjson
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Protocol, Tuple
+from app.config import LLM_MODEL, settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend(Protocol):
+    """Minimal async key/value interface used by LLMCache"""
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        ...
+
+
+class MemoryBackend:
+    """
+    In-process LRU cache backed by an OrderedDict
+
+    Entries expire after their TTL and the least recently
+    used entry is evicted once max_size is reached.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+
+class RedisBackend:
+    """
+    Redis-backed cache shared across workers
+
+    Requires the optional `redis` package (redis.asyncio).
+    """
+
+    def __init__(self, url: str, prefix: str = "echotruth:llm:"):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(self.prefix + key)
+        if raw is None:
+            return None
+        return orjson.loads(raw)
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: int) -> None:
+        await self._redis.set(self.prefix + key, orjson.dumps(value), ex=ttl)
+
+
+class LLMCache:
+    """
+    Exact-match cache for LLM classification results
+
+    Key = blake2b of the quantized features, language and model,
+    so a cached verdict is never reused across models.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: Optional[int] = None):
+        self.backend = backend or _default_backend()
+        self.ttl = ttl if ttl is not None else settings.LLM_CACHE_TTL
+
+    @staticmethod
+    def make_key(features: Dict[str, Any], language: str) -> str:
+        """
+        Build a deterministic cache key
+
+        Numeric features are quantized to 4 decimals so repeated
+        uploads of the same audio map to the same key even when
+        extraction differs in the last digits.
+        """
+        canonical = {
+            name: round(value, 4) if isinstance(value, float) else value
+            for name, value in features.items()
+        }
+        payload = orjson.dumps(
+            {
+                "features": canonical,
+                "lang": language,
+                "model": LLM_MODEL,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result or None on miss"""
+        try:
+            value = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        return dict(value) if value is not None else None
+
+    async def set(self, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store a result; cache failures never break classification"""
+        try:
+            await self.backend.set(key, dict(value), ttl if ttl is not None else self.ttl)
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+
+# Process-wide default backend, shared by every LLMCache instance
+_DEFAULT_BACKEND: Optional[CacheBackend] = None
+
+
+def _default_backend() -> CacheBackend:
+    """Pick the backend from configuration (created once per process)"""
+    global _DEFAULT_BACKEND
+    if _DEFAULT_BACKEND is None:
+        if settings.REDIS_URL:
+            try:
+                _DEFAULT_BACKEND = RedisBackend(settings.REDIS_URL)
+            except ImportError:
+                logger.warning("REDIS_URL set but redis is not installed, using in-memory cache")
+        if _DEFAULT_BACKEND is None:
+            _DEFAULT_BACKEND = MemoryBackend(max_size=settings.LLM_CACHE_MAX_SIZE)
+    return _DEFAULT_BACKEND
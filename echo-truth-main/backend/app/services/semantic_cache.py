@@ -0,0 +1,89 @@
+"""
+semantic_cache.py
+Nearest-neighbour cache for LLM classification results
+
+The four audio features already form a small numeric
+vector, so near-identical clips (the same audio re-encoded,
+trimmed, or re-uploaded) can reuse a prior LLM verdict
+without any embedding model: a query hits when its scaled
+L2 distance to a stored vector is below a threshold.
+
+============================================
+DISTANCE SCALES
+============================================
+Each feature is divided by its scale before comparison:
+- duration:       60.0 (seconds)
+- silence_ratio:   1.0
+- avg_volume:      0.2
+- pitch_variance:  1.0
+============================================
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional
+from app.config import settings
+
+FEATURE_NAMES = ("duration", "silence_ratio", "avg_volume", "pitch_variance")
+FEATURE_SCALES = np.array([60.0, 1.0, 0.2, 1.0], dtype=np.float32)
+
+
+class _Ring:
+    """Fixed-capacity FIFO of (vector, result) pairs for one language"""
+
+    def __init__(self, capacity: int):
+        self.keys = np.zeros((capacity, len(FEATURE_NAMES)), dtype=np.float32)
+        self.values: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self.size = 0
+        self.next = 0
+
+
+class SemanticCache:
+    """
+    Approximate cache keyed by the scaled feature vector
+
+    Entries are kept per language in a ring buffer; once
+    max_size is reached the oldest entry is overwritten.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, max_size: Optional[int] = None):
+        self.threshold = threshold if threshold is not None else settings.SEMANTIC_CACHE_THRESHOLD
+        self.max_size = max_size if max_size is not None else settings.SEMANTIC_CACHE_MAX_SIZE
+        self._rings: Dict[str, _Ring] = {}
+
+    @staticmethod
+    def _vector(features: Dict[str, Any]) -> np.ndarray:
+        """Scaled float32 feature vector"""
+        raw = np.array([features.get(name, 0.0) for name in FEATURE_NAMES], dtype=np.float32)
+        return raw / FEATURE_SCALES
+
+    def get(self, features: Dict[str, Any], language: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the nearest stored result, if close enough
+
+        Returns:
+            Cached result dict or None on miss
+        """
+        ring = self._rings.get(language)
+        if ring is None or ring.size == 0:
+            return None
+
+        dists = np.linalg.norm(ring.keys[:ring.size] - self._vector(features), axis=1)
+        best = int(dists.argmin())
+        if dists[best] >= self.threshold:
+            return None
+
+        return dict(ring.values[best])
+
+    def add(self, features: Dict[str, Any], language: str, result: Dict[str, Any]) -> None:
+        """Store a validated result, evicting the oldest entry when full"""
+        if self.max_size <= 0:
+            return
+
+        ring = self._rings.get(language)
+        if ring is None:
+            ring = self._rings[language] = _Ring(self.max_size)
+
+        ring.keys[ring.next] = self._vector(features)
+        ring.values[ring.next] = dict(result)
+        ring.next = (ring.next + 1) % self.max_size
+        ring.size = min(ring.size + 1, self.max_size)
@@ -0,0 +1,35 @@
+"""
+features.py
+Typed audio feature record
+
+AudioService returns features as a plain dict (it is also
+what the LLM prompt and cache keys consume). Code that reads
+the same fields repeatedly converts it once to a
+FeatureRecord and then uses attribute access.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, Dict
+
+
+@dataclass(slots=True, frozen=True)
+class FeatureRecord:
+    """
+    The four scalar features used for classification
+
+    Defaults match the heuristic fallback's assumptions for
+    a missing feature (neutral, i.e. not suggesting AI).
+    """
+
+    duration: float = 0.0
+    silence_ratio: float = 0.1
+    avg_volume: float = 0.05
+    pitch_variance: float = 0.5
+
+    @classmethod
+    def from_dict(cls, features: Dict[str, Any]) -> "FeatureRecord":
+        """Build a record from a features dict, ignoring unknown keys"""
+        return cls(**{name: features[name] for name in _FIELD_NAMES if name in features})
+
+
+_FIELD_NAMES = tuple(f.name for f in fields(FeatureRecord))
@@ -0,0 +1,70 @@
+"""
+heuristic_numba.py
+Heuristic rule constants and the Numba batch rule kernel
+
+The three fallback rules of DecisionService are frozen here
+as module constants, shared by the scalar path and the
+compiled batch kernel (Numba bakes the globals in at compile
+time).
+
+Per item the kernel writes a 3-bit mask of the rules that
+fired, evaluating all three rules in a single pass over the
+feature columns:
+- bit 2: low pitch variance   (pitch_variance < 0.15)
+- bit 1: low silence ratio    (silence_ratio < 0.05)
+- bit 0: normalized volume    (0.03 < avg_volume < 0.08)
+
+The ai_score is the dot product of the fired rules with
+RULE_WEIGHTS. With only 8 possible masks, that product is
+taken once at import for every mask (MASK_SCORES) and the
+per-item score is a table lookup.
+"""
+
+import numpy as np
+from numba import njit
+
+# Rule thresholds
+PITCH_VARIANCE_MAX = 0.15
+SILENCE_RATIO_MAX = 0.05
+VOLUME_MIN = 0.03
+VOLUME_MAX = 0.08
+
+# ai_score at or above this is AI_GENERATED
+AI_SCORE_THRESHOLD = 0.5
+
+# Weights of (pitch, silence, volume), in mask bit order 2, 1, 0
+RULE_WEIGHTS = np.array([0.4, 0.3, 0.2], dtype=np.float64)
+
+# (8, 3) fired-rule matrix for every mask, and its scores.
+# Rounded so e.g. 0.4 + 0.3 + 0.2 compares exactly as 0.9.
+_MASK_RULES = np.array(
+    [[(m >> 2) & 1, (m >> 1) & 1, m & 1] for m in range(8)], dtype=np.float64
+)
+MASK_SCORES = np.round(_MASK_RULES @ RULE_WEIGHTS, 4)
+
+
+@njit(
+    "void(float64[::1], float64[::1], float64[::1], int8[::1])",
+    fastmath=True,
+    cache=True,
+    boundscheck=False,
+)
+def heuristic_masks(pv, sr, av, mask):
+    """
+    Evaluate the heuristic rules for a batch of feature vectors
+
+    Args:
+        pv: pitch_variance per item
+        sr: silence_ratio per item
+        av: avg_volume per item
+        mask: Output, 3-bit mask of the rules that fired
+    """
+    for i in range(pv.shape[0]):
+        m = 0
+        if pv[i] < PITCH_VARIANCE_MAX:
+            m |= 4
+        if sr[i] < SILENCE_RATIO_MAX:
+            m |= 2
+        if VOLUME_MIN < av[i] < VOLUME_MAX:
+            m |= 1
+        mask[i] = m
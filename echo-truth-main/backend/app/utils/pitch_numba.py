@@ -0,0 +1,104 @@
+"""
+pitch_numba.py
+Numba-compiled pitch variance kernel
+
+Only the variance of F0 is needed for classification, so
+instead of a full pitch tracker (pyin/yin) this estimates
+F0 per frame with normalized autocorrelation, compiled
+with Numba. The kernel is serial and releases the GIL
+(nogil=True), so requests run it concurrently in
+asyncio.to_thread workers without stalling the event loop;
+a parallel region per request would oversubscribe the CPU
+(and is not safe to enter from several threads under
+Numba's default workqueue threading layer).
+
+Audio is float32 end to end: inner products accumulate in
+float32 (8-wide on AVX2) and only the final variance is
+computed in float64. The explicit signature compiles the
+kernel at import (cache=True stores it in __pycache__)
+and rejects float64 input instead of silently upcasting.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(
+    "float64(float32[::1], int64, int64, int64, float64, float64, float64, float64)",
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def frame_pitch_variance(y, sr, frame, hop, fmin, fmax, min_rms, voicing):
+    """
+    Variance of frame-wise F0 (Hz^2) over voiced frames
+
+    Per frame, the autocorrelation is normalized by frame
+    energy and overlap length. The pitch period is the first
+    peak after the first zero crossing that reaches 90% of
+    the best peak. Frames count as voiced when the best peak
+    exceeds `voicing` and the frame RMS is at least `min_rms`.
+
+    Args:
+        y: Mono float32 audio samples (contiguous)
+        sr: Sample rate
+        frame: Frame length in samples
+        hop: Hop length in samples
+        fmin: Lowest pitch to search (Hz)
+        fmax: Highest pitch to search (Hz)
+        min_rms: Frames quieter than this are treated as silence
+        voicing: Minimum normalized autocorrelation peak
+
+    Returns:
+        F0 variance, or 0.0 if fewer than two voiced frames
+    """
+    if len(y) < frame:
+        return 0.0
+
+    n = (len(y) - frame) // hop + 1
+    f0 = np.zeros(n, np.float32)
+    lag_lo = max(int(sr // fmax), 1)
+    lag_hi = min(int(sr // fmin), frame - 1)
+    min_energy = min_rms * min_rms * frame
+
+    for i in range(n):
+        start = i * hop
+
+        energy = np.float32(0.0)
+        for k in range(frame):
+            energy += y[start + k] * y[start + k]
+        if energy <= 0.0 or energy < min_energy:
+            continue
+
+        # Unbiased, energy-normalized autocorrelation per lag
+        r = np.zeros(lag_hi + 1, np.float32)
+        for lag in range(lag_lo, lag_hi + 1):
+            acc = np.float32(0.0)
+            for k in range(frame - lag):
+                acc += y[start + k] * y[start + k + lag]
+            r[lag] = acc * frame / ((frame - lag) * energy)
+
+        # Skip the zero-lag lobe before looking for the period peak
+        first = lag_lo
+        while first <= lag_hi and r[first] >= 0.0:
+            first += 1
+        if first > lag_hi:
+            continue
+
+        peak = 0.0
+        for lag in range(first, lag_hi + 1):
+            if r[lag] > peak:
+                peak = r[lag]
+        if peak < voicing:
+            continue
+
+        # Shortest lag close to the best peak avoids octave errors
+        for lag in range(first, lag_hi + 1):
+            if r[lag] >= 0.9 * peak and (lag == lag_hi or r[lag] >= r[lag + 1]):
+                f0[i] = sr / lag
+                break
+
+    voiced = f0[f0 > 0]
+    if voiced.size > 1:
+        return voiced.astype(np.float64).var()
+    return 0.0
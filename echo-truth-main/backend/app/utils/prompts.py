@@ -2,9 +2,66 @@
 prompts.py
 LLM prompt templates
 
-Contains the classification prompt used for LLM-based detection.
+Contains the classification prompts used for LLM-based detection:
+- get_classification_prompt: one feature set → one JSON object
+- get_batch_classification_prompt: many feature sets → one JSON array
 """
 
+import orjson
+
+# Shared forensic rules (no format fields, safe to concatenate)
+_ANALYSIS_RULES = """ANALYSIS RULES:
+- Overly consistent pitch (low pitch_variance < 0.15) → Suggests AI generation
+- Lack of micro-pauses (low silence_ratio < 0.05) → Suggests AI generation  
+- Very normalized volume levels → Suggests AI processing
+- Natural pitch variation → Suggests human speech
+- Presence of breathing pauses → Suggests human speech
+- Variable volume dynamics → Suggests human speech"""
+
+
+# Static instructions first, per-request features last: the
+# prompt prefix is identical across requests, so provider-side
+# prefix caches can reuse it. Only the short features block is
+# formatted per call.
+_STATIC_PREAMBLE = """You are an audio forensic analyst specializing in detecting AI-generated speech.
+
+You will be given the features of one voice recording at the end of this message.
+
+""" + _ANALYSIS_RULES + """
+
+Based on the features and these rules, determine if the audio is AI-generated or authentic human speech.
+
+Return ONLY a valid JSON object with this exact structure:
+{
+    "classification": "AI_GENERATED" or "HUMAN",
+    "confidence": <number between 0 and 1>,
+    "explanation": "<explanation in max 240 characters>"
+}
+
+Important:
+- Return ONLY the JSON, no other text
+- Confidence should reflect certainty (0.5 = uncertain, 1.0 = very certain)
+- Explanation should be concise and technical"""
+
+_FEATURES_TEMPLATE = """
+
+AUDIO FEATURES:
+- Duration: {duration} seconds
+- Silence Ratio: {silence_ratio:.2%}
+- Average Volume (RMS): {avg_volume:.6f}
+- Pitch Variance (normalized): {pitch_variance:.4f}
+- Language: {language}
+
+Respond now."""
+
+# Defaults for features missing from the input dict
+_FEATURE_DEFAULTS = {
+    "duration": 0,
+    "silence_ratio": 0,
+    "avg_volume": 0,
+    "pitch_variance": 0,
+}
+
 
 def get_classification_prompt(features: dict, language: str = "en") -> str:
     """
@@ -15,6 +72,9 @@ def get_classification_prompt(features: dict, language: str = "en") -> str:
     2. Apply forensic analysis rules
     3. Return a structured JSON response
     
+    The static preamble comes first and the features last,
+    so every prompt shares the same prefix.
+    
     Args:
         features: Dict with duration, silence_ratio, avg_volume, pitch_variance
         language: Audio language code
@@ -22,53 +82,75 @@ def get_classification_prompt(features: dict, language: str = "en") -> str:
     Returns:
         Formatted prompt string
     """
-    
-    # Format features for prompt
-    features_str = f"""
-- Duration: {features.get('duration', 0)} seconds
-- Silence Ratio: {features.get('silence_ratio', 0):.2%}
-- Average Volume (RMS): {features.get('avg_volume', 0):.6f}
-- Pitch Variance (normalized): {features.get('pitch_variance', 0):.4f}
-- Language: {language}
-"""
-    
-    prompt = f"""You are an audio forensic analyst specializing in detecting AI-generated speech.
+    return _STATIC_PREAMBLE + _fmt_features(features, language)
 
-Given the following voice audio features:
-{features_str}
 
-ANALYSIS RULES:
-- Overly consistent pitch (low pitch_variance < 0.15) → Suggests AI generation
-- Lack of micro-pauses (low silence_ratio < 0.05) → Suggests AI generation  
-- Very normalized volume levels → Suggests AI processing
-- Natural pitch variation → Suggests human speech
-- Presence of breathing pauses → Suggests human speech
-- Variable volume dynamics → Suggests human speech
+def _fmt_features(features: dict, language: str) -> str:
+    """Format the per-request features block of the prompt"""
+    return _FEATURES_TEMPLATE.format_map(_FEATURE_DEFAULTS | features | {"language": language})
 
-Based on these features and rules, determine if this audio is AI-generated or authentic human speech.
 
-Return ONLY a valid JSON object with this exact structure:
-{{
-    "classification": "AI_GENERATED" or "HUMAN",
-    "confidence": <number between 0 and 1>,
-    "explanation": "<explanation in max 240 characters>"
-}}
+_BATCH_TEMPLATE = """You are an audio forensic analyst specializing in detecting AI-generated speech.
+
+You will be given a JSON array at the end of this message. Each item holds the voice
+audio features of one recording (silence_ratio is a 0-1 fraction).
+
+""" + _ANALYSIS_RULES + """
+
+For each item, determine if the audio is AI-generated or authentic human speech.
+
+Return ONLY a valid JSON array with one object per input item, in the same order as the input:
+[
+    {{
+        "classification": "AI_GENERATED" or "HUMAN",
+        "confidence": <number between 0 and 1>,
+        "explanation": "<explanation in max 240 characters>"
+    }}
+]
 
 Important:
-- Return ONLY the JSON, no other text
+- Return ONLY the JSON array, no other text
 - Confidence should reflect certainty (0.5 = uncertain, 1.0 = very certain)
-- Explanation should be concise and technical"""
+- Explanation should be concise and technical
+
+AUDIO FEATURES ({count} items):
+{items}
+
+Respond now."""
+
+
+def get_batch_classification_prompt(items: list) -> str:
+    """
+    Build one prompt that classifies several feature sets at once
+    
+    Args:
+        items: List of (features, language) tuples
+        
+    Returns:
+        Formatted prompt string asking for a JSON array of results
+    """
+    payload = [
+        {
+            **{key: features.get(key, default) for key, default in _FEATURE_DEFAULTS.items()},
+            "language": language,
+        }
+        for features, language in items
+    ]
+    return _BATCH_TEMPLATE.format(
+        items=orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode(),
+        count=len(items),
+    )
+
 
-    return prompt
+_LANG_NAMES = {
+    "en": "English",
+    "hi": "Hindi",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "ml": "Malayalam",
+}
 
 
 def get_language_name(code: str) -> str:
     """Get full language name from code"""
-    languages = {
-        "en": "English",
-        "hi": "Hindi",
-        "ta": "Tamil",
-        "te": "Telugu",
-        "ml": "Malayalam",
-    }
-    return languages.get(code, "Unknown")
+    return _LANG_NAMES.get(code, "Unknown")
@@ -0,0 +1,91 @@
+"""
+rms_numba.py
+Numba-compiled RMS / silence statistics kernel
+
+Replaces librosa.feature.rms + np.mean + np.max + the silence
+mask with one fused kernel. The audio is read exactly once:
+squared samples are summed into hop-sized blocks, and each
+frame's energy is the sum of frame // hop consecutive blocks.
+The remaining passes only touch the small per-frame array.
+
+Framing matches librosa.feature.rms defaults (centered,
+zero-padded frames).
+
+Samples are float32 and each block accumulates in float32;
+the rolling frame sums use float64 so the running
+add/subtract does not drift.
+
+The kernel releases the GIL (nogil=True), so feature
+extraction in asyncio.to_thread does not block the event loop.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(
+    "UniTuple(float64, 3)(float32[::1], int64, int64, float64)",
+    fastmath=True,
+    cache=True,
+    nogil=True,
+)
+def rms_stats(y, frame, hop, silence_fraction):
+    """
+    Frame RMS statistics in a single read of the audio
+
+    Args:
+        y: Mono float32 audio samples (contiguous)
+        frame: Frame length in samples (multiple of hop)
+        hop: Hop length in samples
+        silence_fraction: Frames below this fraction of the
+            max RMS count as silence
+
+    Returns:
+        (avg_rms, max_rms, silence_ratio)
+    """
+    if frame % hop != 0 or (frame // 2) % hop != 0:
+        raise ValueError("frame and frame // 2 must be multiples of hop")
+
+    n = len(y)
+    half = frame // 2
+    offset = half // hop
+    blocks_per_frame = frame // hop
+    n_frames = 1 + n // hop
+    n_blocks = n_frames - 1 + blocks_per_frame
+
+    # Single pass over the samples: sum of squares per hop block.
+    # Leading blocks correspond to the zero padding and stay 0.
+    blocks = np.zeros(n_blocks, np.float64)
+    for b in range(offset, n_blocks):
+        start = (b - offset) * hop
+        if start >= n:
+            break
+        stop = min(start + hop, n)
+        acc = np.float32(0.0)
+        for k in range(start, stop):
+            acc += y[k] * y[k]
+        blocks[b] = acc
+
+    # Frame energies from rolling block sums
+    rms = np.empty(n_frames, np.float64)
+    window = 0.0
+    for b in range(blocks_per_frame):
+        window += blocks[b]
+    total = 0.0
+    max_r = 0.0
+    for i in range(n_frames):
+        if i > 0:
+            window += blocks[i + blocks_per_frame - 1] - blocks[i - 1]
+        r = np.sqrt(max(window, 0.0) / frame)
+        rms[i] = r
+        total += r
+        if r > max_r:
+            max_r = r
+
+    threshold = max_r * silence_fraction
+    silent = 0
+    for i in range(n_frames):
+        if rms[i] < threshold:
+            silent += 1
+
+    return total / n_frames, max_r, silent / n_frames
@@ -6,7 +6,43 @@ Validates request inputs before processing.
 """
 
 import re
-from typing import Optional
+import sys
+import math
+import binascii
+import ipaddress
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+# ============================================
+# Lookup tables and patterns built once at import
+# ============================================
+# Reference pattern; binascii's strict mode agrees with it except
+# for a trailing newline (which `$` accepts), so it is used for
+# that case and wherever binascii has no strict mode (< 3.11)
+_B64_RE = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
+_B64_STRICT = sys.version_info >= (3, 11)
+
+# Longest base64 payload accepted (~100 MB decoded), checked
+# before any scan so oversized input is rejected in O(1)
+MAX_B64_CHARS = 140_000_000
+
+# Path separators and null bytes, deleted via str.translate
+_FN_TRANS = str.maketrans('', '', '/\\:\x00')
+
+_URL_SCHEMES = frozenset(('http', 'https'))
+# DNS-style hostname (dot-separated [a-z0-9-] labels); urlparse
+# lowercases the hostname and does not validate its characters.
+# Labels cannot overlap across the dot, so matching is linear.
+_HOST_RE = re.compile(r'(?:[a-z0-9-]+\.)*[a-z0-9-]+\.?')
+# urlsplit silently drops tab/CR/LF, so whitespace is checked first
+_WS_RE = re.compile(r'\s')
+_AUDIO_EXTS = ('.mp3', '.wav', '.ogg', '.m4a', '.webm', '.flac')
+
+_SUPPORTED_LANGS = frozenset(('en', 'hi', 'ta', 'te', 'ml'))
+
+# Feature contract (docs/adr/001-feature-sample-rate.md)
+_FEATURE_KEYS = ('duration', 'silence_ratio', 'avg_volume', 'pitch_variance')
+FEATURE_MAX_SAMPLE_RATE = 8000
 
 
 def validate_audio_url(url: str) -> bool:
@@ -22,26 +58,65 @@ def validate_audio_url(url: str) -> bool:
     if not url:
         return False
     
-    # Check URL format
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-        r'localhost|'  # localhost
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+    # Check URL format (no whole-URL regex, so no backtracking)
+    if _WS_RE.search(url):
+        return False
+    
+    try:
+        parsed = urlparse(url)
+        parsed.port  # raises ValueError for a non-numeric port
+    except ValueError:
+        return False
+    
+    if parsed.scheme not in _URL_SCHEMES or not _valid_host(parsed.hostname):
+        return False
     
-    if not url_pattern.match(url):
+    # No userinfo (user:pw@host), as with the original URL pattern
+    if parsed.username is not None or parsed.password is not None:
         return False
     
-    # Check for audio extension (loose check)
-    audio_extensions = ['.mp3', '.wav', '.ogg', '.m4a', '.webm', '.flac']
-    has_audio_ext = any(ext in url.lower() for ext in audio_extensions)
-    has_audio_in_path = 'audio' in url.lower() or 'sound' in url.lower()
+    # Check for audio extension or audio-ish path (loose check;
+    # the query string and host are not considered)
+    path_lc = parsed.path.lower()
+    has_audio_ext = path_lc.endswith(_AUDIO_EXTS)
+    has_audio_in_path = 'audio' in path_lc or 'sound' in path_lc
     
     return has_audio_ext or has_audio_in_path
 
 
+def _valid_host(host: Optional[str]) -> bool:
+    """Check a parsed hostname: DNS name, IPv4 or bracketed IPv6"""
+    if not host:
+        return False
+    if ':' in host:
+        try:
+            ipaddress.IPv6Address(host)
+            return True
+        except ValueError:
+            return False
+    return _HOST_RE.fullmatch(host) is not None
+
+
+def strip_data_url_prefix(data: str) -> str:
+    """
+    Remove a data URL prefix ("data:audio/wav;base64,")
+    
+    Same result as data.split(',')[1], without building the
+    list: the text after the first comma, up to the next one.
+    
+    Args:
+        data: Base64 string, optionally with a data URL prefix
+        
+    Returns:
+        The base64 payload
+    """
+    idx = data.find(',')
+    if idx == -1:
+        return data
+    end = data.find(',', idx + 1)
+    return data[idx + 1:] if end == -1 else data[idx + 1:end]
+
+
 def validate_base64(data: str) -> bool:
     """
     Validate base64 encoded data
@@ -52,21 +127,25 @@ def validate_base64(data: str) -> bool:
     Returns:
         True if valid base64
     """
-    if not data:
+    if not data or len(data) > MAX_B64_CHARS:
         return False
     
     # Remove data URL prefix if present
-    if ',' in data:
-        data = data.split(',')[1]
+    data = strip_data_url_prefix(data)
     
-    # Check base64 pattern
-    base64_pattern = re.compile(r'^[A-Za-z0-9+/]*={0,2}$')
-    
-    # Check length is multiple of 4
+    # Check length is multiple of 4 (cheap early reject)
     if len(data) % 4 != 0:
         return False
     
-    return bool(base64_pattern.match(data))
+    if not _B64_STRICT or data.endswith('\n'):
+        return bool(_B64_RE.match(data))
+    
+    # Strict decode checks alphabet and padding in one C pass
+    try:
+        binascii.a2b_base64(data, strict_mode=True)
+        return True
+    except (binascii.Error, ValueError):
+        return False
 
 
 def validate_language(code: str) -> bool:
@@ -79,8 +158,7 @@ def validate_language(code: str) -> bool:
     Returns:
         True if supported language
     """
-    supported = ['en', 'hi', 'ta', 'te', 'ml']
-    return code.lower() in supported
+    return code.lower() in _SUPPORTED_LANGS
 
 
 def sanitize_filename(filename: str) -> str:
@@ -94,8 +172,37 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove path separators and null bytes
-    filename = re.sub(r'[/\\:\x00]', '', filename)
+    filename = filename.translate(_FN_TRANS)
     # Remove leading dots
     filename = filename.lstrip('.')
     # Limit length
     return filename[:100] if filename else 'audio'
+
+
+def validate_feature_dict(features: Dict[str, Any]) -> bool:
+    """
+    Validate a features dict against the feature contract
+    
+    The four scalar features must be present, finite and
+    non-negative, and the `sample_rate` provenance key must
+    show they were computed on audio of at most 8 kHz.
+    
+    Args:
+        features: Features dict from AudioService.extract_features
+        
+    Returns:
+        True if the features satisfy the contract
+    """
+    if not isinstance(features, dict):
+        return False
+    
+    sample_rate = features.get('sample_rate')
+    if not isinstance(sample_rate, int) or not 0 < sample_rate <= FEATURE_MAX_SAMPLE_RATE:
+        return False
+    
+    for key in _FEATURE_KEYS:
+        value = features.get(key)
+        if not isinstance(value, (int, float)) or not math.isfinite(value) or value < 0:
+            return False
+    
+    return True
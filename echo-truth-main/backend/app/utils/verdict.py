@@ -0,0 +1,49 @@
+"""
+verdict.py
+Schema for a single LLM classification verdict
+
+The same msgspec schema is used both to decode a well-formed
+LLM response and to validate an already-parsed result, so
+decoding and validation happen in one C-level pass instead
+of json.loads followed by manual isinstance/range checks.
+"""
+
+import msgspec
+from typing import Annotated, Any, Dict, Literal, Optional, Union
+
+
+class LLMVerdict(msgspec.Struct):
+    """classification / confidence / explanation as returned to clients"""
+
+    classification: Literal["AI_GENERATED", "HUMAN"]
+    confidence: Annotated[float, msgspec.Meta(ge=0, le=1)]
+    explanation: Annotated[str, msgspec.Meta(min_length=1, max_length=240)]
+
+
+_DECODER = msgspec.json.Decoder(LLMVerdict)
+
+
+def decode_verdict(raw: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Decode and validate one JSON verdict
+
+    Args:
+        raw: JSON object text
+
+    Returns:
+        Result dict, or None if the JSON is malformed or does
+        not match the schema exactly
+    """
+    try:
+        return msgspec.to_builtins(_DECODER.decode(raw))
+    except (msgspec.DecodeError, msgspec.ValidationError):
+        return None
+
+
+def is_valid_verdict(result: Any) -> bool:
+    """Check a parsed result dict against the verdict schema"""
+    try:
+        msgspec.convert(result, LLMVerdict)
+        return True
+    except msgspec.ValidationError:
+        return False